@@ -1,5 +1,6 @@
 """Extreme value analysis functions."""
 
+import dask
 from matplotlib.dates import date2num
 import numpy as np
 from scipy.optimize import minimize
@@ -34,13 +35,14 @@ def event_in_context(data, threshold, direction):
     """
 
     n_population = len(data)
+    n_below = np.sum(data < threshold)
     if direction == "below":
-        n_events = np.sum(data < threshold)
+        n_events = n_below
     elif direction == "above":
         n_events = np.sum(data > threshold)
     else:
         raise ValueError("""direction must be 'below' or 'above'""")
-    percentile = (np.sum(data < threshold) / n_population) * 100
+    percentile = (n_below / n_population) * 100
     return_period = n_population / n_events
 
     return n_events, n_population, return_period, percentile
@@ -601,6 +603,8 @@ def gev_return_curve(
     bootstrap_method="non-parametric",
     n_bootstraps=1000,
     max_return_period=4,
+    with_dask=True,
+    scheduler=None,
 ):
     """Return x and y data for a GEV return period curve.
 
@@ -613,6 +617,13 @@ def gev_return_curve(
     n_bootstraps : int, default 1000
     max_return_period : float, default 4
         The maximum return period is 10^{max_return_period}
+    with_dask : bool, default True
+        If True, use dask to parallelize the bootstrap fits using dask.delayed
+    scheduler : str, optional
+        Dask scheduler for the bootstrap fits (e.g. 'processes').
+        Defaults to the active dask client or scheduler configuration.
+        The fits are GIL bound, so the default threaded scheduler runs
+        them one at a time.
     """
 
     # GEV fit to data
@@ -626,25 +637,33 @@ def gev_return_curve(
     event_return_period = 1.0 / event_probability
 
     # Bootstrapping for confidence interval
-    boot_values = curve_values
-    boot_event_return_periods = []
-    for i in range(n_bootstraps):
-        if bootstrap_method == "parametric":
-            boot_data = genextreme.rvs(shape, loc=loc, scale=scale, size=len(data))
-        elif bootstrap_method == "non-parametric":
-            boot_data = np.random.choice(data, size=data.shape, replace=True)
-        boot_shape, boot_loc, boot_scale = fit_gev(boot_data, generate_estimates=True)
-
-        boot_value = genextreme.isf(
-            curve_probabilities, boot_shape, boot_loc, boot_scale
-        )
-        boot_values = np.vstack((boot_values, boot_value))
+    seeds = np.random.randint(np.iinfo(np.int32).max, size=n_bootstraps)
+    if with_dask:
+        fit_ = dask.delayed(_bootstrap_gev_fit)
+        data_ = dask.delayed(data)  # Avoid hashing data for every bootstrap
+    else:
+        fit_ = _bootstrap_gev_fit
+        data_ = data
+    boot_params = [
+        fit_(data_, (shape, loc, scale), bootstrap_method, seed) for seed in seeds
+    ]
+    if with_dask:
+        boot_params = dask.compute(boot_params, scheduler=scheduler)[0]
+    boot_shape, boot_loc, boot_scale = np.array(boot_params).T
+
+    # Evaluate all bootstrap parameter sets at once (n_bootstraps, n_curve)
+    boot_values = genextreme.isf(
+        curve_probabilities,
+        boot_shape[:, np.newaxis],
+        boot_loc[:, np.newaxis],
+        boot_scale[:, np.newaxis],
+    )
+    boot_values = np.vstack((curve_values, boot_values))
 
-        boot_event_probability = genextreme.sf(
-            event_value, boot_shape, loc=boot_loc, scale=boot_scale
-        )
-        boot_event_return_period = 1.0 / boot_event_probability
-        boot_event_return_periods.append(boot_event_return_period)
+    boot_event_probability = genextreme.sf(
+        event_value, boot_shape, loc=boot_loc, scale=boot_scale
+    )
+    boot_event_return_periods = 1.0 / boot_event_probability
 
     curve_values_lower_ci = np.quantile(boot_values, 0.025, axis=0)
     curve_values_upper_ci = np.quantile(boot_values, 0.975, axis=0)
@@ -655,7 +674,6 @@ def gev_return_curve(
         curve_values_upper_ci,
     )
 
-    boot_event_return_periods = np.array(boot_event_return_periods)
     boot_event_return_periods = boot_event_return_periods[
         np.isfinite(boot_event_return_periods)
     ]
@@ -670,6 +688,73 @@ def gev_return_curve(
     return curve_data, event_data
 
 
+def _bootstrap_gev_fit(data, params, bootstrap_method, seed):
+    """Fit a stationary GEV to a single bootstrap sample of data.
+
+    Parameters
+    ----------
+    data : array_like
+        Data to resample
+    params : tuple of floats
+        Shape, location and scale parameters (for parametric resampling)
+    bootstrap_method : {'parametric', 'non-parametric'}
+    seed : int
+        Seed for the random number generator
+
+    Returns
+    -------
+    shape, loc, scale : float
+        GEV parameters of the bootstrap sample
+    """
+
+    rng = np.random.default_rng(seed)
+    if bootstrap_method == "parametric":
+        shape, loc, scale = params
+        boot_data = genextreme.rvs(
+            shape, loc=loc, scale=scale, size=len(data), random_state=rng
+        )
+    elif bootstrap_method == "non-parametric":
+        boot_data = rng.choice(data, size=data.shape, replace=True)
+
+    return fit_gev(boot_data, generate_estimates=True)
+
+
+def _empirical_return_periods(data, max_points=100000, n_ranks=500):
+    """Empirical return values and periods, ranked from largest to smallest.
+
+    Parameters
+    ----------
+    data : array_like
+        Data used to estimate the empirical return periods
+    max_points : int, default 100000
+        Maximum number of points to return
+    n_ranks : int, default 500
+        Number of log-spaced ranks to return if data is larger than max_points
+
+    Returns
+    -------
+    return_values : numpy ndarray
+        Data values in descending order
+    return_periods : numpy ndarray
+        Empirical return period of each value
+
+    Notes
+    -----
+    Large datasets are thinned to log-spaced ranks, which appear evenly
+    spaced on a log return period axis and are much quicker to plot.
+    """
+
+    return_values = np.sort(data, axis=None)[::-1]
+    n = return_values.size
+    ranks = np.arange(1, n + 1)
+    if n > max_points:
+        ranks = np.unique(np.logspace(0, np.log10(n), n_ranks).astype(int))
+        return_values = return_values[ranks - 1]
+    return_periods = n / ranks
+
+    return return_values, return_periods
+
+
 def plot_gev_return_curve(
     ax,
     data,
@@ -681,6 +766,8 @@ def plot_gev_return_curve(
     ylabel=None,
     ylim=None,
     text=False,
+    with_dask=True,
+    scheduler=None,
 ):
     """Plot a single return period curve.
 
@@ -702,6 +789,10 @@ def plot_gev_return_curve(
         Limits for y-axis
     text : bool, default False
        Write the return period (and 95% CI) on the plot
+    with_dask : bool, default True
+        If True, use dask to parallelize the bootstrap fits using dask.delayed
+    scheduler : str, optional
+        Dask scheduler for the bootstrap fits (see `gev_return_curve`)
     """
 
     if direction == "deceedance":
@@ -713,6 +804,8 @@ def plot_gev_return_curve(
         bootstrap_method=bootstrap_method,
         n_bootstraps=n_bootstraps,
         max_return_period=max_return_period,
+        with_dask=with_dask,
+        scheduler=scheduler,
     )
     (
         curve_return_periods,
@@ -748,8 +841,7 @@ def plot_gev_return_curve(
         linestyle=":",
         label="95% CI for record event",
     )
-    empirical_return_values = np.sort(data, axis=None)[::-1]
-    empirical_return_periods = len(data) / np.arange(1.0, len(data) + 1.0)
+    empirical_return_values, empirical_return_periods = _empirical_return_periods(data)
     ax.scatter(
         empirical_return_periods,
         empirical_return_values,
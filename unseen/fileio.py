@@ -5,14 +5,19 @@ import zipfile
 import shutil
 import argparse
 import logging
+import functools
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 
-import git
 import yaml
 import numpy as np
 import pandas as pd
 import geopandas as gp
 import xarray as xr
+import zarr
+import numcodecs
 import cmdline_provenance as cmdprov
+from dask.distributed import default_client
 
 from . import general_utils
 from . import spatial_selection
@@ -21,6 +26,8 @@ from . import array_handling
 from . import dask_setup
 from . import indices
 
+_ZARR_V3 = int(zarr.__version__.split(".")[0]) >= 3
+
 
 def open_dataset(
     infiles,
@@ -67,8 +74,13 @@ def open_dataset(
     file_format : str, optional
         Formats/engines accepted by xarray.open_dataset (e.g. netcdf4, zarr, cfgrid).
         Estimated if not provided.
-    chunks : dict, optional
-        Chunks for xarray.open_mfdataset
+    chunks : dict or 'preferred', optional
+        Chunks for xarray.open_mfdataset.
+        If 'preferred', use integer multiples of the native (on-disk) chunks
+        of the first input file that target ~128 MB dask chunks.
+        If False, open a single input file without dask (numpy-backed).
+        (The command line program does this for a single observational input
+        file under 2 GB unless input chunks or a dask configuration are given.)
     metadata_file : str
         YAML file path specifying required file metadata changes
     variables : list, optional
@@ -144,9 +156,20 @@ def open_dataset(
 
     preprocess = time_utils.switch_calendar if standard_calendar else None
     engine = file_format if file_format else _guess_file_format(infiles)
-    ds = xr.open_mfdataset(
-        infiles, engine=engine, preprocess=preprocess, use_cftime=True, chunks=chunks
-    )
+    if chunks == "preferred":
+        chunks = _preferred_chunks(infiles, engine)
+    if chunks is False:
+        ds = xr.open_dataset(_single_file(infiles), engine=engine, use_cftime=True)
+        if preprocess:
+            ds = preprocess(ds)
+    else:
+        ds = xr.open_mfdataset(
+            infiles,
+            engine=engine,
+            preprocess=preprocess,
+            use_cftime=True,
+            chunks=chunks,
+        )
 
     # Metadata
     if metadata_file:
@@ -215,7 +238,10 @@ def open_dataset(
 
     # Temporal aggregation
     if no_leap_days:
-        ds = ds.sel(time=~((ds[time_dim].dt.month == 2) & (ds[time_dim].dt.day == 29)))
+        months = ds[time_dim].dt.month.values
+        days = ds[time_dim].dt.day.values
+        leap_days = (months == 2) & (days == 29)
+        ds = ds.isel({time_dim: np.flatnonzero(~leap_days)})
     if rolling_sum_window:
         ds = ds.rolling({time_dim: rolling_sum_window}).sum()
     if time_freq:
@@ -250,6 +276,90 @@ def open_dataset(
     return ds
 
 
+def estimated_bytes(infile, file_format=None):
+    """Estimate the uncompressed size of a data file.
+
+    Parameters
+    ----------
+    infile : str
+        Input file path
+    file_format : str, optional
+        Formats/engines accepted by xarray.open_dataset (e.g. netcdf4, zarr, cfgrid).
+        Estimated if not provided.
+
+    Returns
+    -------
+    nbytes : int
+        Total size (in bytes) of all variables once loaded into memory
+    """
+
+    engine = file_format if file_format else _guess_file_format(infile)
+    with xr.open_dataset(infile, engine=engine, chunks=None, decode_times=False) as ds:
+        nbytes = sum(
+            np.prod(var.shape, dtype=np.int64) * var.dtype.itemsize
+            for var in ds.variables.values()
+        )
+
+    return int(nbytes)
+
+
+def _single_file(infiles):
+    """Return the file path from a single file path or single item list"""
+
+    if isinstance(infiles, list):
+        assert len(infiles) == 1, "Expected a single input file"
+        infiles = infiles[0]
+
+    return infiles
+
+
+def _preferred_chunks(infiles, engine, target_bytes=128 * 2**20):
+    """Dask chunks that are integer multiples of the native file chunks.
+
+    Parameters
+    ----------
+    infiles : str or list
+        Input file path/s (only the first file is inspected)
+    engine : str
+        Format/engine accepted by xarray.open_dataset
+    target_bytes : int, default 128 MB
+        Target size of each dask chunk
+
+    Returns
+    -------
+    chunks : dict
+        Dimension names (keys) and dask chunk sizes (values)
+    """
+
+    infile = infiles[0] if isinstance(infiles, list) else infiles
+    with xr.open_dataset(infile, engine=engine, chunks=None, decode_times=False) as ds:
+        data_vars = sorted(
+            ds.data_vars.values(), key=lambda da: da.nbytes, reverse=True
+        )
+        chunks = {}
+        for da in data_vars:
+            native_chunks = da.encoding.get("preferred_chunks", {})
+            if not native_chunks:
+                continue
+            native_chunks = {d: native_chunks.get(d, da.sizes[d]) for d in da.dims}
+            native_bytes = np.prod(list(native_chunks.values())) * da.dtype.itemsize
+            multiplier = max(1, int(target_bytes // native_bytes))
+            for dim, native in native_chunks.items():
+                factor = min(multiplier, -(-da.sizes[dim] // native))
+                chunks.setdefault(dim, min(native * factor, da.sizes[dim]))
+                multiplier = max(1, multiplier // factor)
+
+    return chunks
+
+
+def _open_file_group(file_group, **kwargs):
+    """Open a group of forecast files with open_dataset."""
+
+    logging.info(f"Processing file group: {file_group}...")
+
+    return open_dataset(file_group, **kwargs)
+
+
 def _chunks(lst, n):
     """Split a list into n sub-lists"""
 
@@ -318,13 +428,21 @@ def open_mfforecast(
     logging.basicConfig(level=log_lev)
 
     infiles = _process_mfilelist(file_list, n_time_files, n_ensemble_files)
+
+    # Opening is latency bound, so open all file groups concurrently
+    file_groups = [group for init_file_group in infiles for group in init_file_group]
+    if not file_groups:
+        raise ValueError(f"No forecast files found in {file_list}")
+    with ThreadPoolExecutor(max_workers=min(32, len(file_groups))) as executor:
+        open_file_group = functools.partial(_open_file_group, **kwargs)
+        ensemble_datasets = iter(list(executor.map(open_file_group, file_groups)))
+
     init_datasets = []
     time_values = []
     for init_file_group in infiles:
         init_ds_group = []
         for init_ensemble_file_group in init_file_group:
-            logging.info(f"Processing file group: {init_ensemble_file_group}...")
-            init_ensemble_ds = open_dataset(init_ensemble_file_group, **kwargs)
+            init_ensemble_ds = next(ensemble_datasets)
             shape = init_ensemble_ds[kwargs["variables"][0]].shape
             logging.info(f"Ensemble member shape: {shape}")
             init_ds_group.append(init_ensemble_ds)
@@ -343,7 +461,24 @@ def open_mfforecast(
         time_values.append(init_ds[time_dim].values)
         init_ds = array_handling.to_init_lead(init_ds)
         init_datasets.append(init_ds)
-    ds = xr.concat(init_datasets, dim=init_dim)
+    first_indexes = init_datasets[0].indexes
+    same_indexes = all(
+        init_ds.indexes.keys() == first_indexes.keys()
+        and all(init_ds.indexes[k].equals(v) for k, v in first_indexes.items())
+        for init_ds in init_datasets[1:]
+    )
+    if same_indexes:
+        # Skip the alignment and coordinate comparisons (slow for many files)
+        ds = xr.concat(
+            init_datasets,
+            dim=init_dim,
+            coords="minimal",
+            compat="override",
+            join="override",
+            combine_attrs="override",
+        )
+    else:
+        ds = xr.concat(init_datasets, dim=init_dim)
     time_values = np.stack(time_values, axis=-1)
     time_dimension = xr.DataArray(
         time_values,
@@ -375,14 +510,38 @@ def get_new_log(infile_logs=None, repo_dir=None):
         New command log
     """
 
+    # Resolve the directory so the cached URL can't go stale after a chdir
+    repo_dir = os.path.abspath(repo_dir or os.getcwd())
+    repo_url = _get_repo_url(repo_dir)
+    new_log = cmdprov.new_log(code_url=repo_url, infile_logs=infile_logs)
+
+    return new_log
+
+
+@functools.lru_cache(maxsize=8)
+def _get_repo_url(repo_dir):
+    """Get (and cache) the remote URL of a git repository.
+
+    Parameters
+    ----------
+    repo_dir : str
+        Absolute path for git repository
+
+    Returns
+    -------
+    repo_url : str or None
+        Remote URL (None if repo_dir is not a git repository)
+    """
+
+    import git  # Slow to import and only needed here
+
     try:
         repo = git.Repo(repo_dir)
         repo_url = repo.remotes[0].url.split(".git")[0]
-    except (git.exc.InvalidGitRepositoryError, NameError):
+    except git.exc.InvalidGitRepositoryError:
         repo_url = None
-    new_log = cmdprov.new_log(code_url=repo_url, infile_logs=infile_logs)
 
-    return new_log
+    return repo_url
 
 
 def to_zarr(ds, file_name):
@@ -396,18 +555,98 @@ def to_zarr(ds, file_name):
         Output file path
     """
 
-    for var in ds.variables:
-        ds[var].encoding = {}
+    for var in ds.variables.values():
+        var.encoding = {}
+
+    zipped = file_name[-4:] == ".zip"
+    zip_store = zipped and _zip_store_writable()
+    if zip_store:
+        # Write straight to the zip file (no intermediate zarr directory)
+        store = zarr.storage.ZipStore(file_name, mode="w")
+    elif zipped:
+        store = file_name[:-4]
+    else:
+        store = file_name
+
+    encoding = _zarr_encoding(ds)
+    try:
+        with _zarr_write_config():
+            ds.to_zarr(store, mode="w", consolidated=True, encoding=encoding)
+    finally:
+        if zip_store:
+            store.close()
+    if zipped and not zip_store:
+        zip_zarr(store, file_name)
+        shutil.rmtree(store)
+
+
+def _zip_store_writable():
+    """Check if a zarr collection can be written directly to a zarr ZipStore.
+
+    Notes
+    -----
+    A ZipStore can't be shared by the worker processes of a dask distributed
+    client, and zarr-python 3 ZipStores are unreadable after xarray rewrites
+    (i.e. duplicates) their metadata entries.
+    """
+
+    if _ZARR_V3:
+        return False
+    try:
+        default_client()
+    except ValueError:
+        return True
+
+    return False
+
+
+def _zarr_encoding(ds):
+    """Explicit zarr compression encoding for each data variable.
+
+    Parameters
+    ----------
+    ds : xarray Dataset
+        Dataset to be written to file
+
+    Returns
+    -------
+    encoding : dict
+        Variable names (keys) and zarr encoding (values)
+    """
+
+    if _ZARR_V3:
+        codec = zarr.codecs.BloscCodec(cname="zstd", clevel=3, shuffle="bitshuffle")
+        compression = {"compressors": (codec,)}
+    else:
+        codec = numcodecs.Blosc(
+            cname="zstd", clevel=3, shuffle=numcodecs.Blosc.BITSHUFFLE
+        )
+        compression = {"compressor": codec}
+    encoding = {var: compression for var in ds.data_vars}
+
+    return encoding
+
+
+def _zarr_write_config(concurrency=32):
+    """Zarr configuration for writing many chunks concurrently.
+
+    Parameters
+    ----------
+    concurrency : int, default 32
+        Maximum number of concurrent store requests (zarr-python 3 only)
+
+    Returns
+    -------
+    config : context manager
+        Temporary zarr configuration
+    """
 
-    if file_name[-4:] == ".zip":
-        zarr_filename = file_name[:-4]
+    if _ZARR_V3:
+        config = zarr.config.set({"async.concurrency": concurrency})
     else:
-        zarr_filename = file_name
+        config = contextlib.nullcontext()
 
-    ds.to_zarr(zarr_filename, mode="w", consolidated=True)
-    if file_name[-4:] == ".zip":
-        zip_zarr(zarr_filename, file_name)
-        shutil.rmtree(zarr_filename)
+    return config
 
 
 def zip_zarr(zarr_filename, zip_filename):
@@ -424,10 +663,20 @@ def zip_zarr(zarr_filename, zip_filename):
     with zipfile.ZipFile(
         zip_filename, "w", compression=zipfile.ZIP_STORED, allowZip64=True
     ) as fh:
-        for root, _, filenames in os.walk(zarr_filename):
-            for each_filename in filenames:
-                each_filename = os.path.join(root, each_filename)
-                fh.write(each_filename, os.path.relpath(each_filename, zarr_filename))
+        prefix_length = len(os.path.join(zarr_filename, ""))
+        for entry in _scandir_files(zarr_filename):
+            fh.write(entry.path, entry.path[prefix_length:])
+
+
+def _scandir_files(path):
+    """Recursively yield os.DirEntry objects for all files under path"""
+
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_files(entry.path)
+            elif entry.is_file():
+                yield entry
 
 
 def _fix_metadata(ds, metadata_file):
@@ -580,7 +829,13 @@ def _parse_command_line():
         nargs="*",
         action=general_utils.store_dict,
         default=None,
-        help="Chunks for reading data (e.g. time=-1)",
+        help="Chunks for reading data (e.g. time=-1) [default=no dask for one obs file < 2 GB without --dask_config]",
+    )
+    parser.add_argument(
+        "--preferred_input_chunks",
+        action="store_true",
+        default=False,
+        help="Read data in chunks that are multiples of the native file chunks (overrides --input_chunks)",
     )
     parser.add_argument(
         "--output_chunks",
@@ -823,7 +1078,7 @@ def _main():
         print(client)
 
     kwargs = {
-        "chunks": args.input_chunks,
+        "chunks": "preferred" if args.preferred_input_chunks else args.input_chunks,
         "metadata_file": args.metadata_file,
         "variables": args.variables,
         "point_selection": args.point_selection,
@@ -859,6 +1114,18 @@ def _main():
 
     kwargs, index = _indices_setup(kwargs, args.variables)
 
+    small_obs_file = (
+        not args.forecast
+        and not args.input_chunks
+        and not args.preferred_input_chunks
+        and not args.dask_config
+        and len(args.infiles) == 1
+        and estimated_bytes(args.infiles[0]) < 2 * 2**30
+    )
+    if small_obs_file:
+        # Small enough to process in memory without dask
+        kwargs["chunks"] = False
+
     if args.forecast:
         ds = open_mfforecast(
             args.infiles,
@@ -882,11 +1149,11 @@ def _main():
             ds, args.anomaly, frequency=args.anomaly_freq, time_name=args.time_dim
         )
 
-    if args.output_chunks:
-        ds = ds.chunk(args.output_chunks)
     if args.time_agg_dates:
         ds = ds.set_coords(("event_time"))
     ds = ds[kwargs["variables"]]
+    if args.output_chunks:
+        ds = ds.chunk(args.output_chunks)
 
     ds.attrs["history"] = get_new_log()
     if "zarr" in args.outfile:
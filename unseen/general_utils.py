@@ -1,7 +1,7 @@
 """General utility functions."""
 
 import argparse
-import xclim
+import xarray as xr
 
 
 class store_dict(argparse.Action):
@@ -14,9 +14,12 @@ class store_dict(argparse.Action):
     """
 
     def __call__(self, parser, namespace, values, option_string=None):
-        setattr(namespace, self.dest, dict())
+        result = {}
+        setattr(namespace, self.dest, result)
         for value in values:
-            key, val = value.split("=")
+            key, sep, val = value.partition("=")
+            if not sep:
+                parser.error(f"{option_string} expects key=value, got {value!r}")
             if ":" in val:
                 start, end = val.split(":")
                 try:
@@ -30,7 +33,7 @@ class store_dict(argparse.Action):
                     val = int(val)
                 except ValueError:
                     pass
-            getattr(namespace, self.dest)[key] = val
+            result[key] = val
 
 
 def convert_units(da, target_units):
@@ -57,15 +60,23 @@ def convert_units(da, target_units):
     if da.attrs["units"] in xclim_unit_check:
         da.attrs["units"] = xclim_unit_check[da.units]
 
-    try:
-        da = xclim.units.convert_units_to(da, target_units)
-    except Exception as e:
-        in_precip_kg = da.attrs["units"] == "kg m-2 s-1"
-        out_precip_mm = target_units in ["mm d-1", "mm day-1"]
-        if in_precip_kg and out_precip_mm:
+    # Common conversions that don't need a units library
+    in_precip_kg = da.attrs["units"] == "kg m-2 s-1"
+    out_precip_mm = target_units in ["mm d-1", "mm day-1", "mm/day"]
+    in_temp_k = da.attrs["units"] in ["K", "degK"]
+    out_temp_c = target_units in ["degC", "deg_C"]
+
+    if in_precip_kg and out_precip_mm:
+        with xr.set_options(keep_attrs=True):
             da = da * 86400
-            da.attrs["units"] = target_units
-        else:
-            raise e
+        da.attrs["units"] = target_units
+    elif in_temp_k and out_temp_c:
+        with xr.set_options(keep_attrs=True):
+            da = da - 273.15
+        da.attrs["units"] = target_units
+    else:
+        import xclim  # Slow to import and only needed here
+
+        da = xclim.units.convert_units_to(da, target_units)
 
     return da
@@ -6,7 +6,13 @@ import numpy.testing as npt
 from scipy.stats import genextreme
 from xarray import cftime_range, DataArray
 
-from unseen.eva import fit_gev, get_return_period, get_return_level
+from unseen.eva import (
+    fit_gev,
+    get_return_period,
+    get_return_level,
+    gev_return_curve,
+    _empirical_return_periods,
+)
 
 rtol = 0.3  # relative tolerance
 alpha = 0.05
@@ -332,3 +338,38 @@ def test_get_return_level_3d():
     return_level = get_return_level(rp, theta)
     assert return_level.shape == rp.shape
     assert np.all(np.isfinite(return_level))
+
+
+def test_gev_return_curve_with_dask():
+    """Check gev_return_curve bootstraps are the same with or without dask."""
+    data, _ = example_da_gev_1d()
+    data = data[:200]
+    event = data.max().item()
+
+    results = []
+    for with_dask in [True, False]:
+        np.random.seed(0)
+        results.append(
+            gev_return_curve(data, event, n_bootstraps=10, with_dask=with_dask)
+        )
+
+    (_, _, lower_ci, upper_ci), _ = results[0]
+    assert np.all(lower_ci[1:] <= upper_ci[1:])
+    for a, b in zip(results[0], results[1]):
+        npt.assert_allclose(a, b)
+
+
+def test_empirical_return_periods_thinned():
+    """Check the thinned empirical return periods of a large sample."""
+    np.random.seed(0)
+    data = np.random.normal(size=20000)
+    n = data.size
+
+    values, periods = _empirical_return_periods(data, max_points=1000, n_ranks=200)
+    ranks = n / periods
+    assert values.size == periods.size < n
+    assert np.all(np.diff(ranks) > 0)
+    npt.assert_allclose(ranks, np.round(ranks))
+    assert periods[0] == n
+    assert values[0] == data.max()
+    assert np.all(np.diff(values) <= 0)
@@ -0,0 +1,88 @@
+"""Test file input/output functions."""
+
+import pytest
+
+import numpy as np
+import xarray as xr
+
+from unseen.fileio import (
+    open_dataset,
+    open_mfforecast,
+    to_zarr,
+    _preferred_chunks,
+    _ZARR_V3,
+)
+
+
+def example_forecast_file(tmp_path, init_year, n_ensemble):
+    """Write an example forecast zarr file and return its path."""
+    time = xr.cftime_range(start=f"{init_year}-11-01", periods=5, freq="D")
+    dims = ["ensemble", "time", "lat", "lon"]
+    data = np.random.rand(n_ensemble, time.size, 2, 3)
+    coords = {
+        "ensemble": np.arange(n_ensemble),
+        "time": time,
+        "lat": [-30.0, -20.0],
+        "lon": [140.0, 150.0, 160.0],
+    }
+    ds = xr.Dataset({"pr": (dims, data)}, coords=coords)
+    infile = str(tmp_path / f"forecast_{init_year}.zarr")
+    ds.to_zarr(infile)
+    return infile
+
+
+@pytest.mark.parametrize("n_ensembles", [(3, 3), (3, 2)])
+def test_open_mfforecast(tmp_path, n_ensembles):
+    """Test concatenating forecasts with equal and unequal ensemble sizes."""
+    infiles = [
+        example_forecast_file(tmp_path, 2000 + i, n_ensemble)
+        for i, n_ensemble in enumerate(n_ensembles)
+    ]
+    ds = open_mfforecast(infiles, variables=["pr"])
+    assert dict(ds["pr"].sizes) == {
+        "init_date": 2,
+        "ensemble": max(n_ensembles),
+        "lead_time": 5,
+        "lat": 2,
+        "lon": 3,
+    }
+    n_missing = (max(n_ensembles) - min(n_ensembles)) * 5 * 2 * 3
+    assert int(ds["pr"].isnull().sum()) == n_missing
+    for i, infile in enumerate(infiles):
+        expected = xr.open_zarr(infile)["pr"].values
+        actual = ds["pr"].isel(init_date=i, ensemble=slice(n_ensembles[i])).values
+        np.testing.assert_allclose(actual, expected)
+
+
+@pytest.mark.parametrize("target_bytes", [8 * 2**10, 64 * 2**10, 2**30])
+def test_preferred_chunks(tmp_path, target_bytes):
+    """Test dask chunks are multiples of the native zarr chunks."""
+    sizes = {"time": 100, "lat": 30, "lon": 40}
+    native = {"time": 7, "lat": 10, "lon": 8}
+    data = np.random.rand(*sizes.values())
+    ds = xr.Dataset({"pr": (list(sizes), data)})
+    infile = str(tmp_path / "example.zarr")
+    ds.to_zarr(infile, encoding={"pr": {"chunks": list(native.values())}})
+
+    chunks = _preferred_chunks(infile, "zarr", target_bytes=target_bytes)
+    assert set(chunks) == set(sizes)
+    for dim, chunk in chunks.items():
+        assert chunk % native[dim] == 0 or chunk == sizes[dim]
+    assert np.prod(list(chunks.values())) * data.itemsize <= target_bytes
+
+    ds_preferred = open_dataset(infile, chunks="preferred")
+    for dim, dask_chunks in ds_preferred["pr"].chunksizes.items():
+        assert dask_chunks[0] % native[dim] == 0 or dask_chunks[0] == sizes[dim]
+
+
+@pytest.mark.skipif(_ZARR_V3, reason="Direct ZipStore writes need zarr-python 2")
+def test_to_zarr_zip(tmp_path):
+    """Test a round trip through a zipped zarr file."""
+    data = np.random.rand(10, 3)
+    ds = xr.Dataset({"pr": (["time", "lat"], data)})
+    outfile = str(tmp_path / "example.zarr.zip")
+    to_zarr(ds, outfile)
+
+    assert not (tmp_path / "example.zarr").exists()
+    ds_read = open_dataset(outfile)
+    np.testing.assert_allclose(ds_read["pr"].values, data)
@@ -0,0 +1,52 @@
+"""Test general utility functions."""
+
+import pytest
+
+import numpy as np
+import numpy.testing as npt
+import xarray as xr
+import xclim
+
+from unseen.general_utils import convert_units
+
+
+def example_da(values, units, standard_name):
+    """An example 1D DataArray with units and standard name attributes."""
+    attrs = {"units": units, "standard_name": standard_name}
+    return xr.DataArray(np.array(values), dims=["time"], attrs=attrs)
+
+
+@pytest.mark.parametrize("target_units", ["mm d-1", "mm day-1", "mm/day"])
+def test_convert_units_precip(target_units):
+    """Test the kg m-2 s-1 to mm/day conversion."""
+    da = example_da([0.0, 1e-5, 2e-4], "kg m-2 s-1", "precipitation_flux")
+    expected = xclim.units.convert_units_to(da.copy(), target_units)
+
+    result = convert_units(da, target_units)
+    npt.assert_allclose(result.values, [0.0, 0.864, 17.28])
+    npt.assert_allclose(result.values, expected.values)
+    assert result.attrs == {
+        "units": target_units,
+        "standard_name": "precipitation_flux",
+    }
+
+
+@pytest.mark.parametrize("units", ["K", "degK"])
+def test_convert_units_temperature(units):
+    """Test the K to degC conversion."""
+    da = example_da([273.15, 300.0], units, "air_temperature")
+    expected = xclim.units.convert_units_to(da.copy(), "degC")
+
+    result = convert_units(da, "degC")
+    npt.assert_allclose(result.values, [0.0, 26.85])
+    npt.assert_allclose(result.values, expected.values)
+    assert result.attrs == {"units": "degC", "standard_name": "air_temperature"}
+
+
+def test_convert_units_xclim():
+    """Test conversions without a shortcut are done by xclim."""
+    da = example_da([273.15, 300.0], "K", "air_temperature")
+
+    result = convert_units(da, "degF")
+    npt.assert_allclose(result.values, [32.0, 80.33])
+    assert result.attrs["units"] in ["degF", "°F"]  # Depends on xclim version
@@ -4,6 +4,7 @@ import numpy as np
 from xarray.coding.times import cftime_to_nptime
 
 from unseen.time_utils import (
+    date_pair_to_time_slice,
     select_time_period,
 )
 
@@ -30,3 +31,12 @@ def test_select_time_period(example_da_forecast, add_nans, data_object):
 
     assert min_time >= np.datetime64(PERIOD[0])
     assert max_time <= np.datetime64(PERIOD[1])
+
+
+def test_date_pair_to_time_slice():
+    """Test date_pair_to_time_slice output and date format check"""
+    time_slice = date_pair_to_time_slice(["1990-01-01", "2019-12-31"])
+    assert time_slice == slice("1990-01-01", "2019-12-31")
+
+    with pytest.raises(AssertionError):
+        date_pair_to_time_slice(["1990", "2019"])
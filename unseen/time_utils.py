@@ -9,6 +9,8 @@ import xarray as xr
 
 from . import array_handling
 
+_DATE_PATTERN = re.compile("([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})")
+
 
 def get_agg_dates(ds, var, target_freq, agg_method, time_dim="time"):
     """Record the date of each time aggregated/resampled event (e.g. annual max)
@@ -222,6 +224,27 @@ def select_time_period(ds, period, time_name="time"):
     return selection
 
 
+def date_pair_to_time_slice(date_list):
+    """Convert a pair of dates to a time slice.
+
+    Parameters
+    ----------
+    date_list : list of str
+        Start and stop dates (in YYYY-MM-DD format)
+
+    Returns
+    -------
+    time_slice : slice
+        Time slice for use with xarray.Dataset.sel
+    """
+
+    _check_date_format(date_list)
+    start_date, end_date = date_list
+    time_slice = slice(start_date, end_date)
+
+    return time_slice
+
+
 def get_clim(
     ds,
     dims,
@@ -374,9 +397,8 @@ def _check_cftime(time_dim):
 def _check_date_format(date_list):
     """Check for YYYY-MM-DD format."""
 
-    date_pattern = "([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})"
     for date in date_list:
-        assert re.search(date_pattern, date), "Date format must be YYYY-MM-DD"
+        assert _DATE_PATTERN.search(date), "Date format must be YYYY-MM-DD"
 
 
 def _crop_to_complete_time_periods(ds, counts, input_freq, output_freq):